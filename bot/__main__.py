@@ -434,7 +434,7 @@ def main() -> None:
         # Check if a valid number of arguments have been passed
         if await parse_usage_text(cmdobj.usage, arguments, message):
             arguments_typed = await parse_types(cmdobj.usage, arguments, message)
-            if arguments_typed == False:
+            if arguments_typed is False:
                 return
             try:
                 await cmdobj.execute(arguments_typed, message)
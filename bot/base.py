@@ -1,9 +1,8 @@
 import asyncio
 import re
-import subprocess
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import aiosqlite
 import discord
@@ -17,6 +16,9 @@ from .sql import SQLParser
 if TYPE_CHECKING:
     from .manager import Manager
 
+# Matches "[optional]" and "<positional>" arguments in a command usage string
+_USAGE_RE = re.compile(r"\[([^\[\]]+)\]|<([^<>]+)>")
+
 
 # @dataclass
 class Command(ABC):
@@ -29,55 +31,66 @@ class Command(ABC):
     category: Optional[str] = None
     file: Optional[str] = None
 
-    db: Optional[SQLParser] = None
+    # Subclasses still get a __dict__ for their own per-instance state
+    __slots__ = ("bot", "manager", "db")
+
+    db: Optional[SQLParser]
     logger = Logger()
 
-    def __init__(self, bot: discord.Client, manager: "Manager", db: SQLParser) -> None:
-        """Initialize the command.
+    # Shared between all commands, keyed by command file
+    _contrib_cache: Dict[str, str] = {}
 
-        [Args]:
-            bot (discord.Client): bot on which we'll use the command
-            manager: (Manager): ?
-            db (SQLParser): command database connection
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Validate a command once, when its class is declared.
 
         [Raises]:
             ValueError: if 'name' field is empty
             ValueError: if 'description' field is empty
             ValueError: if 'usage' field is empty
+            ValueError: if the 'usage' arguments are out of order
+            TypeError: if 'execute' is not a coroutine
         """
 
-        self.bot = bot
-        self.manager = manager
-        self.db = db
+        super().__init_subclass__(**kwargs)
 
-        if not self.name:
+        if not cls.name:
             raise ValueError("Command name is required")
 
-        if not self.description:
+        if not cls.description:
             raise ValueError("Command description is required")
 
-        if not self.usage:
+        if not cls.usage:
             raise ValueError("Command usage is required")
         else:
-            args: List[Tuple[str, str]] = re.findall(
-                f"\[([^\[\]]+)\]|\<([^\<\>]+)\>", self.usage
-            )
-            args: List[str] = [f"<{i[1]}>" if i[1] else f"[{i[0]}]" for i in args]
-
             # Verify the integredy of the usage arguments
-            last_arg = "< "
-            for arg in args:
-                if arg[0] == "<" and last_arg[0] == "[":
+            seen_optional = False
+            seen_star = False
+            for optional, positional in _USAGE_RE.findall(cls.usage):
+                if positional and seen_optional:
                     raise ValueError(
                         "Cannot have a positional argument after an optional argument."
                     )
-                if last_arg[1] == "*":
+                if seen_star:
                     raise ValueError("Cannot have a command argument after a *arg.")
-                last_arg = arg
+                seen_optional = seen_optional or bool(optional)
+                seen_star = (optional or positional).startswith("*")
 
-        if not asyncio.iscoroutinefunction(self.execute):
+        if not asyncio.iscoroutinefunction(cls.execute):
             raise TypeError("Command execute() method must be a coroutine")
 
+    def __init__(self, bot: discord.Client, manager: "Manager", db: SQLParser) -> None:
+        """Initialize the command.
+
+        [Args]:
+            bot (discord.Client): bot on which we'll use the command
+            manager: (Manager): ?
+            db (SQLParser): command database connection
+        """
+
+        self.bot = bot
+        self.manager = manager
+        self.db = db
+
     @abstractmethod
     async def execute(self, arguments: List[str], message: discord.Message) -> None:
         """Execute the command.
@@ -93,25 +106,33 @@ class Command(ABC):
         raise NotImplementedError("Command execute method is required")
 
     async def get_contributers(self) -> str:
-        res = (
-            subprocess.run(
-                [
-                    "git",
-                    "shortlog",
-                    "-n",
-                    "-s",
-                    "HEAD",
-                    "--",
-                    f"bot/commands/{self.file}",
-                ],
-                capture_output=True,
-            )
-            .stdout.decode()
-            .strip("\n")
+        """Get the commit counts per author for this command's file.
+
+        Successful results are cached per file, so `git shortlog` only runs once.
+        """
+
+        cache = self.__class__._contrib_cache
+        if self.file in cache:
+            return cache[self.file]
+
+        proc = await asyncio.create_subprocess_exec(
+            "git",
+            "shortlog",
+            "-n",
+            "-s",
+            "HEAD",
+            "--",
+            f"bot/commands/{self.file}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        lines = res.split("\n")
-        colums = [i.strip().split() for i in lines]
-        text = "\n".join([f"{i[0]:<9}{i[1]}" for i in colums])
+        stdout, _ = await proc.communicate()
+        # Each line is "<padded count>\t<author>"
+        colums = (line.strip().partition("\t") for line in stdout.decode().splitlines())
+        text = "\n".join(f"{count:<9}{author}" for count, _, author in colums)
+        # Leave failed runs (e.g. not a git checkout) uncached so they are retried
+        if proc.returncode == 0:
+            cache[self.file] = text
         return text
 
 
@@ -120,7 +141,9 @@ class Event(ABC):
 
     name: Optional[str] = None
 
-    db: Optional[SQLParser] = None
+    __slots__ = ("bot", "manager", "db")
+
+    db: Optional[SQLParser]
     logger = Logger()
 
     def __init__(self, bot: discord.Client, manager: "Manager", db: SQLParser) -> None:
@@ -158,7 +181,9 @@ class Task(ABC):
 
     name: Optional[str] = None
 
-    db: Optional[SQLParser] = None
+    __slots__ = ("bot", "manager", "db")
+
+    db: Optional[SQLParser]
     logger = Logger()
 
     def __init__(self, bot: discord.Client, manager: "Manager", db: SQLParser) -> None:
@@ -184,41 +209,49 @@ class Task(ABC):
         raise NotImplementedError("Task execute method is required")
 
 
+def _role_menu_page(
+    whitelist: Tuple[str, ...], index: int
+) -> List[discord.SelectOption]:
+    """Build the select options of the RoleMenu page starting at `index`."""
+
+    options = []
+    page = whitelist[index : index + 23]
+    end = index + 23 >= len(whitelist)
+    if len(whitelist) == 0:
+        options.append(
+            discord.SelectOption(
+                label="No Options Available", value="No Options Available"
+            )
+        )
+    if index > 0:
+        options.append(
+            discord.SelectOption(label="<-- Previous Page", value="Previous Page")
+        )
+    options += [
+        discord.SelectOption(label=f"{i+1}. {role}", value=role)
+        for i, role in enumerate(page, start=index)
+    ]
+    if not end:
+        options.append(discord.SelectOption(label=f"Next Page -->", value="Next Page"))
+    return options
+
+
 class RoleMenu(discord.ui.Select):
     def __init__(self, whitelist):
         super().__init__()
-        self.whitelist = sorted(whitelist)
+        self.whitelist = tuple(sorted(whitelist))
         self.index = 0
         self.page = 1
         self.placeholder = f"Page {self.page}"
+        # Pages already visited in this menu, keyed by their start index
+        self._options_by_page: Dict[int, List[discord.SelectOption]] = {}
         self.regenerateMenu()
 
     def regenerateMenu(self):
-        options = []
-        begin = True
-        end = False
-        if len(self.whitelist) == 0:
-            options.append(
-                discord.SelectOption(
-                    label="No Options Available", value="No Options Available"
-                )
-            )
-        if begin == True and self.index > 0:
-            options.append(
-                discord.SelectOption(label="<-- Previous Page", value="Previous Page")
-            )
-            begin = False
-        for i in range(self.index, self.index + 23):
-            try:
-                role = self.whitelist[i]
-                options.append(discord.SelectOption(label=f"{i+1}. {role}", value=role))
-            except IndexError:
-                end = True
-                pass
-        if end == False:
-            options.append(
-                discord.SelectOption(label=f"Next Page -->", value="Next Page")
-            )
+        options = self._options_by_page.get(self.index)
+        if options is None:
+            options = _role_menu_page(self.whitelist, self.index)
+            self._options_by_page[self.index] = options
         self.options = options
 
     def NextPage(self):
@@ -233,111 +266,99 @@ class RoleMenu(discord.ui.Select):
         self.placeholder = f"Page {self.page}"
         self.regenerateMenu()
 
+    _navigation = {"Next Page": NextPage, "Previous Page": PreviousPage}
+
     async def callback(self, interaction):
         message = self.view.message
-        whitelist = self.view.whitelist
         selection = self.values[0]
         action = self.view.action
 
         if message.author.id != interaction.user.id:
             return
-        if selection == "Next Page":
-            self.NextPage()
-            await interaction.message.edit(view=self.view)
-            await interaction.response.defer()
+        await interaction.response.defer()
+        # Page navigation only has to update the select menu
+        navigate = self._navigation.get(selection)
+        if navigate is not None:
+            navigate(self)
+            await interaction.edit_original_response(view=self.view)
             return
-        if selection == "Previous Page":
-            self.PreviousPage()
-            await interaction.message.edit(view=self.view)
-            await interaction.response.defer()
+
+        # Guild roles may have changed since the last interaction
+        self.view._roles_by_name = None
+        # Prevents empty select menu
+        if selection == "No Options Available":
+            self.view.regenerateMenu()
+            await interaction.edit_original_response(
+                embed=self.view.default_embed, view=self.view
+            )
             return
-        else:
-            # Prevents empty select menu
-            if selection == "No Options Available":
-                self.view.regenerateMenu()
-                await interaction.message.edit(
-                    embed=self.view.default_embed, view=self.view
-                )
-                await interaction.response.defer()
-                return
 
-            if action == "Remove":
-                # Removes the selected role
-                role = self.view.getRoleByName(self.view.message, self.values[0])
-                await message.author.remove_roles(role)
-                # Removes the role from the server if the role is now empty
-                if len(role.members) == 0:
-                    await role.delete()
-                embed = Embed(
-                    title=f"{self.view.cap}",
-                    description=f"`{message.author.name}` has been removed from the `{selection}` {self.view.prefix} role",
-                )
-                self.view.regenerateMenu()
-                await interaction.message.edit(embed=embed, view=self.view)
-                await interaction.response.defer()
-                return
+        if action == "Remove":
+            # Removes the selected role
+            role = self.view.getRoleByName(self.view.message, self.values[0])
+            await message.author.remove_roles(role)
+            # Removes the role from the server if the role is now empty
+            if len(role.members) == 0:
+                await role.delete()
+            embed = Embed(
+                title=self.view.cap,
+                description=f"`{message.author.name}` has been removed from the `{selection}` {self.view.prefix} role",
+            )
+            self.view.regenerateMenu()
+            await interaction.edit_original_response(embed=embed, view=self.view)
+            return
 
-            elif action == "Add":
-                # Gets user's current bot given roles
-                user_roles = [
-                    x
-                    for x in message.author.roles
-                    if x.name.lower() in list(map(lambda role: role.lower(), whitelist))
-                ]
-                # Ensures roles dont exceed maximum amound of allowed roles
-                if len(user_roles) >= self.view.max:
-                    embed = Embed(
-                        title=f"{self.view.cap}",
-                        description=f"`{message.author.name}` already has the max amount of {self.view.prefix} roles",
-                    )
-                    embed.set_color("red")
-                    self.view.regenerateMenu()
-                    await interaction.message.edit(embed=embed, view=self.view)
-                    await interaction.response.defer()
-                    return
-                # Checks if role already exists, if not, creates it
-                if selection.lower() not in [
-                    x.name.lower() for x in message.guild.roles
-                ]:
-                    await message.guild.create_role(
-                        name=selection, colour=self.view.role_color
-                    )
-                # Adds user to selected role
-                try:
-                    await message.author.add_roles(
-                        self.view.getRoleByName(message, selection)
-                    )
-                except AttributeError:
-                    embed = Embed(
-                        title=f"{self.view.cap}",
-                        description=f"Something went wrong, lets try that again",
-                    )
-                    embed.set_color("red")
-                    self.view.regenerateMenu()
-                    await interaction.message.edit(embed=embed, view=self.view)
-                    await interaction.response.defer()
-                    return
+        elif action == "Add":
+            # Ensures roles dont exceed maximum amound of allowed roles
+            if self.view.hasMaxRoles(message):
                 embed = Embed(
-                    title=f"{self.view.cap}",
-                    description=f"`{message.author.name}` has been added to the `{selection}` {self.view.prefix} role",
+                    title=self.view.cap,
+                    description=f"`{message.author.name}` already has the max amount of {self.view.prefix} roles",
                 )
+                embed.set_color("red")
                 self.view.regenerateMenu()
-                await interaction.message.edit(embed=embed, view=self.view)
-                await interaction.response.defer()
+                await interaction.edit_original_response(embed=embed, view=self.view)
                 return
-
-            elif action == "Users":
-                users = 0
-                if selection.lower() in [x.name.lower() for x in message.guild.roles]:
-                    users = len(self.view.getRoleByName(message, selection).members)
+            # Checks if role already exists, if not, creates it
+            if self.view.getRoleByName(message, selection) is None:
+                role = await message.guild.create_role(
+                    name=selection, colour=self.view.role_color
+                )
+                self.view.getRolesByName(message)[role.name.lower()] = role
+            # Adds user to selected role
+            try:
+                await message.author.add_roles(
+                    self.view.getRoleByName(message, selection)
+                )
+            except AttributeError:
                 embed = Embed(
-                    title=f"{self.view.cap}",
-                    description=f"`{selection}` has `{users}` users on this server",
+                    title=self.view.cap,
+                    description="Something went wrong, lets try that again",
                 )
+                embed.set_color("red")
                 self.view.regenerateMenu()
-                await interaction.message.edit(embed=embed, view=self.view)
-                await interaction.response.defer()
+                await interaction.edit_original_response(embed=embed, view=self.view)
                 return
+            embed = Embed(
+                title=self.view.cap,
+                description=f"`{message.author.name}` has been added to the `{selection}` {self.view.prefix} role",
+            )
+            self.view.regenerateMenu()
+            await interaction.edit_original_response(embed=embed, view=self.view)
+            return
+
+        elif action == "Users":
+            users = 0
+            role = self.view.getRoleByName(message, selection)
+            if role is not None:
+                users = len(role.members)
+            embed = Embed(
+                title=self.view.cap,
+                description=f"`{selection}` has `{users}` users on this server",
+            )
+            self.view.regenerateMenu()
+            await interaction.edit_original_response(embed=embed, view=self.view)
+            return
 
 
 class BackButton(discord.ui.Button):
@@ -349,42 +370,40 @@ class BackButton(discord.ui.Button):
     async def callback(self, interaction):
         if self.view.message.author.id != interaction.user.id:
             return
-        self.view.regenerateMenu()
-        await interaction.message.edit(embed=self.view.default_embed, view=self.view)
         await interaction.response.defer()
+        self.view.regenerateMenu()
+        await interaction.edit_original_response(
+            embed=self.view.default_embed, view=self.view
+        )
 
 
 class RolesButton(discord.ui.Button):
-    def __init__(self):
+    def __init__(self, label="None"):
         super().__init__()
         self.style = discord.ButtonStyle.primary
-        self.label = "None"
+        self.label = label
         self.action = self.label
 
     # self.view.* attributes are only available in the callback
     async def callback(self, interaction):
         if self.view.message.author.id != interaction.user.id:
             return
+        await interaction.response.defer()
         self.whitelist = self.view.whitelist
 
         # Only gives a list of removable rolls to the select menu
         if self.action == "Remove":
             self.whitelist = [
-                x.name
-                for x in self.view.message.author.roles
-                if x.name.lower()
-                in list(map(lambda role: role.lower(), self.view.whitelist))
+                x.name for x in self.view.getAuthorRoles(self.view.message)
             ]
 
         # Only gives a list of available roles to the select menu
         if self.action == "Add":
+            author_roles = {
+                role.name.lower() for role in self.view.message.author.roles
+            }
             self.whitelist = [
-                x
-                for x in self.view.whitelist
-                if x.lower()
-                not in list(
-                    map(lambda role: role.name.lower(), self.view.message.author.roles)
-                )
+                x for x in self.view.whitelist if x.lower() not in author_roles
             ]
 
         self.view.action = self.action
@@ -395,82 +414,46 @@ class RolesButton(discord.ui.Button):
             title=f"{self.view.cap} {self.action}",
             description=f"Please select an option",
         )
-        await interaction.message.edit(embed=embed, view=self.view)
-        await interaction.response.defer()
-
-
-class AddRolesButton(RolesButton):
-    def __init__(self):
-        super().__init__()
-        self.label = "Add"
-        self.action = self.label
-
-
-class RemoveRolesButton(RolesButton):
-    def __init__(self):
-        super().__init__()
-        self.label = "Remove"
-        self.action = self.label
-
-
-class UsersRolesButton(RolesButton):
-    def __init__(self):
-        super().__init__()
-        self.label = "Users"
-        self.action = self.label
+        await interaction.edit_original_response(embed=embed, view=self.view)
 
 
 class YourRolesButton(RolesButton):
     def __init__(self):
-        super().__init__()
-        self.label = "Your Roles"
-        self.action = self.label
+        super().__init__("Your Roles")
 
     async def callback(self, interaction):
         if self.view.message.author.id != interaction.user.id:
             return
-        user_roles = [
-            x.name
-            for x in self.view.message.author.roles
-            if x.name.lower()
-            in list(map(lambda role: role.lower(), self.view.whitelist))
-        ]
-        desc = ""
-        for role in user_roles:
-            desc += f"`{role}`\n"
-        embed = Embed(title=f"Your {self.view.cap} Roles", description=f"{desc}")
-        await interaction.message.edit(embed=embed, view=self.view)
         await interaction.response.defer()
+        desc = "\n".join(
+            f"`{x.name}`" for x in self.view.getAuthorRoles(self.view.message)
+        )
+        embed = Embed(title=f"Your {self.view.cap} Roles", description=f"{desc}")
+        await interaction.edit_original_response(embed=embed, view=self.view)
 
 
 class LeaderboardRolesButton(RolesButton):
     def __init__(self):
-        super().__init__()
-        self.label = "Leaderboard"
-        self.action = self.label
+        super().__init__("Leaderboard")
 
     async def callback(self, interaction):
         if self.view.message.author.id != interaction.user.id:
             return
+        await interaction.response.defer()
 
-        leaderboard = []
-        desc = ""
-        roles = [
-            x
+        # (name, member count) of every whitelisted role that has members
+        leaderboard = [
+            (x.name, len(x.members))
             for x in self.view.message.guild.roles
-            if x.name.lower()
-            in list(map(lambda role: role.lower(), self.view.whitelist))
+            if x.name.lower() in self.view._whitelist_lower and x.members
         ]
-        for role in roles:
-            leaderboard.append({"role": role, "count": len(role.members)})
-        leaderboard = sorted(leaderboard, key=lambda d: d["count"], reverse=True)
-        for i, role in enumerate(leaderboard):
-            if i == 10:
-                break
-            desc += f"**#{i+1}** `{role['role']}` users: {role['count']}\n"
+        leaderboard.sort(key=lambda entry: entry[1], reverse=True)
+        desc = "\n".join(
+            f"**#{i+1}** `{name}` users: {count}"
+            for i, (name, count) in enumerate(leaderboard[:10])
+        )
         embed = Embed(title=f"{self.view.cap} Leaderboard", description=f"{desc}")
-        await interaction.message.edit(embed=embed, view=self.view)
-        await interaction.response.defer()
+        await interaction.edit_original_response(embed=embed, view=self.view)
 
 
 class RoleView(discord.ui.View):
@@ -485,24 +468,49 @@ class RoleView(discord.ui.View):
         self.message = message
         self.selection = None
         self.action = None
+        self._roles_by_name = None
         self.cap = self.prefix.capitalize()
+        # Maps lowercased role names to their whitelisted spelling
+        self._whitelist_lower = {role.lower(): role for role in self.whitelist}
         self.default_embed = Embed(
-            title=f"{self.cap}", description="Please select an option"
+            title=self.cap, description="Please select an option"
+        )
+        # The main menu buttons are re-added on every regenerateMenu call
+        self._default_buttons = (
+            RolesButton("Add"),
+            RolesButton("Remove"),
+            YourRolesButton(),
+            LeaderboardRolesButton(),
+            RolesButton("Users"),
         )
         self.regenerateMenu()
 
     def regenerateMenu(self):
         self.clear_items()
-        self.add_item(AddRolesButton())
-        self.add_item(RemoveRolesButton())
-        self.add_item(YourRolesButton())
-        self.add_item(LeaderboardRolesButton())
-        self.add_item(UsersRolesButton())
+        for button in self._default_buttons:
+            self.add_item(button)
+
+    def getAuthorRoles(self, message):
+        """Get the author's roles that are on the whitelist."""
+        return [
+            role
+            for role in message.author.roles
+            if role.name.lower() in self._whitelist_lower
+        ]
+
+    def hasMaxRoles(self, message):
+        return len(self.getAuthorRoles(message)) >= self.max
+
+    def getRolesByName(self, message):
+        """Map lowercased role names to the guild's roles, built once per interaction."""
+        if self._roles_by_name is None:
+            self._roles_by_name = {
+                role.name.lower(): role for role in message.guild.roles
+            }
+        return self._roles_by_name
 
     def getRoleByName(self, message, role_name):
-        for role in message.guild.roles:
-            if role.name.lower() == role_name.lower():
-                return role
+        return self.getRolesByName(message).get(role_name.lower())
 
 
 if __name__ == "__main__":
@@ -6,14 +6,17 @@ class event(Event):
 
     async def execute(self) -> None:
         await self.bot.wait_until_ready()
-        registered = [
+        registered = {
             int(x[0])
             for x in (await self.db.raw_exec_select("SELECT user_id FROM levels"))
-        ]
-        for member in [x for x in self.bot.get_all_members() if not x.bot]:
-            if member.id in registered:
-                continue
-            await self.db.raw_exec_commit(
-                "INSERT INTO levels VALUES (?, ?, ?, ?, ?)",
-                (member.id, 0, 0, "255 255 255", None),
-            )
+        }
+        # Members sharing several guilds with the bot are yielded more than once
+        new_members = {
+            member.id
+            for member in self.bot.get_all_members()
+            if not member.bot and member.id not in registered
+        }
+        await self.db.raw_exec_many(
+            "INSERT INTO levels VALUES (?, ?, ?, ?, ?)",
+            [(member_id, 0, 0, "255 255 255", None) for member_id in new_members],
+        )
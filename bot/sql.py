@@ -10,6 +10,9 @@ class SQLParser:
     def __init__(self, file: str, create_statemets: List[str]) -> None:
         self.file = file
         self.create_statemets = create_statemets
+        # Shared by every query, created on first use
+        self.pool: Optional[aiomysql.Pool] = None
+        self.pool_lock = asyncio.Lock()
 
     @staticmethod
     def connect(func):
@@ -20,15 +23,17 @@ class SQLParser:
             if len(args) > 0 and isinstance(args[0], aiomysql.connection.Connection):
                 res = await func(self, *args, **kwargs)
             else:
-                pool = await aiomysql.create_pool(
-                    host=Config.mysql_host,
-                    port=Config.mysql_port,
-                    user=Config.mysql_user,
-                    password=Config.mysql_password,
-                    db=Config.mysql_database,
-                    autocommit=True,
-                )
-                async with pool.acquire() as db:
+                async with self.pool_lock:
+                    if self.pool is None:
+                        self.pool = await aiomysql.create_pool(
+                            host=Config.mysql_host,
+                            port=Config.mysql_port,
+                            user=Config.mysql_user,
+                            password=Config.mysql_password,
+                            db=Config.mysql_database,
+                            autocommit=True,
+                        )
+                async with self.pool.acquire() as db:
                     async with db.cursor() as cur:
                         res = await func(self, db, cur, *args, **kwargs)
 
@@ -63,6 +68,20 @@ class SQLParser:
         sql = sql.replace("?", "%s")
         await cur.execute(sql, vals)
 
+    @connect
+    async def raw_exec_many(
+        self,
+        db: aiomysql.connection.Connection,
+        cur: aiomysql.cursors.Cursor,
+        sql: str,
+        vals: List[Tuple],
+    ) -> None:
+        """Execute an sql statement once per set of values in a single batch"""
+        if not vals:
+            return
+        sql = sql.replace("?", "%s")
+        await cur.executemany(sql, vals)
+
     # Add custom db methods here if you need more control
 
     @connect